@@ -16,23 +16,39 @@ It uses the industry standard method for estimating the quantity of fixtures req
 # Fundamental math operations and array handling
 import numpy as np  
 
-# Data manipulation and CSV file handling
-import pandas as pd  
-
-# Basic math functions (ceil, floor, etc.)
-import math  
+# Lightweight stdlib CSV parsing for the small UF tables
+import csv
 
 # GUI creation - windows, buttons, labels
 import tkinter as tk  
 
-# File dialogs and message boxes
-from tkinter import filedialog, messagebox  
+# File dialogs and message boxes are imported lazily inside the
+# callbacks that need them, so they don't slow down the initial
+# GUI paint on launch
 
 # Enhanced GUI widgets (better looking UI elements)
-from tkinter import ttk  
+from tkinter import ttk
+
+# Off-screen image rendering so all fixtures become one canvas item
+from PIL import Image, ImageDraw, ImageTk
 
 # Logging program activity for debugging
-import logging  
+import logging
+
+# File timestamps used as cache keys for loaded CSV files
+import os
+
+# In-memory text buffers so each CSV is only read from disk once
+import io
+
+# Caching helpers (lru_cache)
+import functools
+
+# Compact record type for fully parsed fixture files
+from dataclasses import dataclass
+
+# Compiled (Numba) numeric kernels for the hot calculation paths
+from utils_numba import _interp_uf, _enumerate_valid
 
 # ==============================================
 # GLOBAL CONSTANTS WITH DESCRIPTIONS
@@ -111,6 +127,26 @@ class ToolTip:
 # ==============================================
 # VISUALIZATION CLASS
 # ==============================================
+
+# Shared 10px fixture dot sprite - rendered once on first use and pasted
+# for every fixture, instead of rasterizing a fresh ellipse per fixture
+_DOT_SPRITE = None
+
+def _get_dot_sprite():
+    """Build (once) and return the shared fixture dot sprite."""
+    global _DOT_SPRITE
+    if _DOT_SPRITE is None:
+        sprite = Image.new("RGBA", (10, 10), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(sprite)
+        draw.ellipse(
+            (0, 0, 9, 9),    # Full sprite area (10px diameter circle)
+            fill="#1f77b4",  # Blue fill color
+            outline="black", # Black border
+            width=1          # Border thickness
+        )
+        _DOT_SPRITE = sprite
+    return _DOT_SPRITE
+
 class LayoutVisualizer:
     def __init__(self, parent_frame):
         """
@@ -121,20 +157,47 @@ class LayoutVisualizer:
         """
         self.parent = parent_frame
         self.canvas_frame = None  # Will hold the canvas widgets
-        self.canvases = []        # Stores references to all created canvases
-        
+        self.canvas_pool = []     # Reusable canvases (created once, kept forever)
+        self.active = 0           # How many pool canvases are currently shown
+
     def setup_visualization_area(self):
         """Create the frame that will contain the visualization canvases"""
         self.canvas_frame = tk.Frame(self.parent)
         self.canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         return self.canvas_frame
-    
+
     def clear_visualizations(self):
-        """Remove all existing visualizations"""
-        for canvas in self.canvases:
-            canvas.destroy()
-        self.canvases = []
-        
+        """Clear all visualizations, keeping the canvases for reuse"""
+        for canvas in self.canvas_pool:
+            canvas.delete("all")         # Wipe the drawn items
+            canvas.fixture_image = None  # Drop the blitted image reference
+            canvas.pack_forget()         # Hide until redrawn
+        self.active = 0
+
+    def _next_canvas(self, canvas_width, canvas_height):
+        """Reuse a pooled canvas, or create one if the pool is exhausted"""
+        if self.active < len(self.canvas_pool):
+            # Reuse an existing canvas - clearing it is far cheaper than
+            # destroying and recreating the widget every redraw
+            canvas = self.canvas_pool[self.active]
+            canvas.delete("all")
+        else:
+            # First time we need this many canvases - create and pool it
+            canvas = tk.Canvas(
+                self.canvas_frame,
+                width=canvas_width,
+                height=canvas_height,
+                bg="white",               # White background color
+                highlightthickness=1,     # Border thickness in pixels
+                highlightbackground="gray" # Border color
+            )
+            self.canvas_pool.append(canvas)
+
+        # Position canvas in parent frame with padding (no-op if already shown)
+        canvas.pack(side=tk.TOP, padx=5, pady=10)
+        self.active += 1
+        return canvas
+
     def draw_room_layout(self, room_length, room_width, layout_data, title):
         """
         Draw a complete room layout visualization with fixtures and spacing information.
@@ -149,31 +212,17 @@ class LayoutVisualizer:
         Args:
             room_length (float): Length of the room in meters
             room_width (float): Width of the room in meters  
-            layout_data (dict): Dictionary containing:
-                'array': Tuple of (columns, rows) for fixture grid
-                'spacing_length': Spacing between fixtures along length (meters)
-                'spacing_width': Spacing between fixtures along width (meters)
+            layout_data (ArrayResult): Arrangement to draw, with the
+                fixture grid in .array and the fixture spacings in
+                .spacing_length / .spacing_width (meters)
             title (str): Title to display at top of visualization
         """
         # 1. CANVAS INITIALIZATION
         canvas_width = 450  # Fixed width for visualization area
         canvas_height = 400  # Fixed height for visualization area
-        
-        # Create canvas with white background and gray border
-        canvas = tk.Canvas(
-            self.canvas_frame,
-            width=canvas_width,
-            height=canvas_height,
-            bg="white",               # White background color
-            highlightthickness=1,     # Border thickness in pixels
-            highlightbackground="gray" # Border color
-        )
-        
-        # Position canvas in parent frame with padding
-        canvas.pack(side=tk.TOP, padx=5, pady=10)
-        
-        # Store reference for later cleanup
-        self.canvases.append(canvas)
+
+        # Grab a (cleared) canvas from the reusable pool
+        canvas = self._next_canvas(canvas_width, canvas_height)
 
         # 2. SCALING AND POSITION CALCULATIONS
         # Calculate scaling factor to fit room in canvas while maintaining aspect ratio
@@ -208,15 +257,15 @@ class LayoutVisualizer:
         # 3.3 Spacing and Edge Information (Below dimensions)
         if layout_data:  # Only display if layout data exists
             # Calculate edge distances (space from walls to first fixture)
-            edge_space_length = (room_length - ((layout_data['array'][0] - 1) * 
-                              layout_data['spacing_length'])) / 2
-            edge_space_width = (room_width - ((layout_data['array'][1] - 1) * 
-                             layout_data['spacing_width'])) / 2
-            
+            edge_space_length = (room_length - ((layout_data.array[0] - 1) *
+                              layout_data.spacing_length)) / 2
+            edge_space_width = (room_width - ((layout_data.array[1] - 1) *
+                             layout_data.spacing_width)) / 2
+
             # Create formatted text string
             spacing_info = (
-                f"Fixture Spacing: {layout_data['spacing_length']:.2f}m (L) × "
-                f"{layout_data['spacing_width']:.2f}m (W)\n"
+                f"Fixture Spacing: {layout_data.spacing_length:.2f}m (L) × "
+                f"{layout_data.spacing_width:.2f}m (W)\n"
                 f"Edge Distance: {edge_space_length:.2f}m (L) × "
                 f"{edge_space_width:.2f}m (W)"
             )
@@ -245,29 +294,41 @@ class LayoutVisualizer:
 
         # 5. FIXTURE PLACEMENT
         if layout_data:  # Only proceed if we have valid layout data
-            array_cols, array_rows = layout_data['array']
-            spacing_length = layout_data['spacing_length']
-            spacing_width = layout_data['spacing_width']
+            array_cols, array_rows = layout_data.array
+            spacing_length = layout_data.spacing_length
+            spacing_width = layout_data.spacing_width
             
             # Calculate edge spaces (distance from walls to first fixture)
             edge_space_length = (room_length - ((array_cols - 1) * spacing_length)) / 2
             edge_space_width = (room_width - ((array_rows - 1) * spacing_width)) / 2
             
-            # Draw each fixture as a blue circle
-            for col in range(array_cols):
-                for row in range(array_rows):
-                    # Calculate fixture position (scaled to canvas coordinates)
-                    x = offset_x + (edge_space_length + col * spacing_length) * scale
-                    y = offset_y + (edge_space_width + row * spacing_width) * scale
-                    
-                    # Draw the fixture (10px diameter circle)
-                    canvas.create_oval(
-                        x - 5, y - 5,  # Top-left coordinates
-                        x + 5, y + 5,  # Bottom-right coordinates
-                        fill="#1f77b4", # Blue fill color
-                        outline="black",# Black border
-                        width=1         # Border thickness
-                    )
+            # Render all fixtures into one transparent off-screen image,
+            # then blit it in a single create_image call - one canvas item
+            # total instead of one per fixture
+            image = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
+            sprite = _get_dot_sprite()
+
+            # Compute every fixture position (scaled to canvas coordinates)
+            # in one broadcasting step - no Python arithmetic per fixture
+            xs = (offset_x + (edge_space_length +
+                  np.arange(array_cols) * spacing_length) * scale).astype(np.int32)
+            ys = (offset_y + (edge_space_width +
+                  np.arange(array_rows) * spacing_width) * scale).astype(np.int32)
+            grid_x, grid_y = np.meshgrid(xs, ys)
+
+            # Sprite top-left corners (the dot is centered on the fixture)
+            coords = np.column_stack([grid_x.ravel(), grid_y.ravel()]) - 5
+
+            for x, y in coords.tolist():
+                # Paste the shared sprite - an alpha-blended C copy, much
+                # cheaper than rasterizing an ellipse for every fixture
+                image.paste(sprite, (x, y), sprite)
+
+            # Blit the finished image as a single canvas item, keeping a
+            # reference on the canvas so Tk's image isn't garbage collected
+            photo = ImageTk.PhotoImage(image)
+            canvas.create_image(0, 0, anchor="nw", image=photo)
+            canvas.fixture_image = photo
 
         # 6. ERROR HANDLING - NO VALID LAYOUT
         if not layout_data:
@@ -283,92 +344,248 @@ class LayoutVisualizer:
 # CSV FILE HANDLING FUNCTIONS
 # ==============================================
 
-def load_uf_table(csv_file_path):
+@dataclass(frozen=True)
+class UFTable:
+    """
+    Utilization factor table as plain NumPy arrays (SoA layout).
+
+    A UF table is tiny (typically a few dozen rows), so parsing it with
+    the stdlib csv module straight into contiguous arrays skips the
+    fixed pandas overhead and directly produces what the interpolation
+    kernel wants.
+    """
+    columns: tuple            # Uf column names (everything after K)
+    K_sorted: np.ndarray      # K values, sorted ascending
+    data_sorted: np.ndarray   # Uf values, rows matching K_sorted
+    refl_rgb: np.ndarray      # (Rc, Rw, Rf) per reflectance column
+    refl_cols: tuple          # Reflectance column names
+    refl_col_idx: np.ndarray  # Positions of those columns in data_sorted
+
+def _to_float(cell):
+    """Convert one CSV cell to float, using NaN for blanks/non-numbers."""
+    try:
+        return float(cell)
+    except ValueError:
+        return float("nan")
+
+def load_uf_table(csv_file):
     """
     Load the utilization factor table from a CSV file.
-    
+
     Args:
-        csv_file_path: Path to the CSV file
-        
+        csv_file: Path to the CSV file, or an open file-like object
+
     Returns:
-        pandas.DataFrame containing the utilization factors
-        
+        UFTable containing the utilization factors as NumPy arrays
+
     Raises:
         ValueError: If file is invalid or cannot be read
     """
     try:
-        # Read CSV, skipping first 7 rows of metadata
-        df = pd.read_csv(csv_file_path, skiprows=7, header=0)
-        
-        # Remove completely empty rows
-        df = df.dropna(how="all")
-        
+        # Read the whole file once (path or already-open buffer)
+        if hasattr(csv_file, "read"):
+            text = csv_file.read()
+        else:
+            with open(csv_file, "r") as file:
+                text = file.read()
+
+        # Skip the first 7 metadata lines and drop completely empty rows;
+        # the next row is the column header
+        rows = [row for row in list(csv.reader(io.StringIO(text)))[7:]
+                if any(cell.strip() for cell in row)]
+        if not rows:
+            raise ValueError("CSV file contains no utilization factor rows.")
+
+        header = [name.strip() for name in rows[0]]
+
         # Verify we have at least 2 columns (K values + reflectance combinations)
-        if df.shape[1] < 2:
+        if len(header) < 2:
             raise ValueError("CSV file must have at least 2 columns.")
-            
-        # Clean up any whitespace in text columns
-        return df.apply(lambda x: x.str.strip() if x.dtype == "object" else x)
-        
+
+        # Coerce the body straight to one float array (short rows are
+        # padded, blank or text cells become NaN)
+        n_cols = len(header)
+        values = np.array(
+            [[_to_float(cell) for cell in (row + [""] * n_cols)[:n_cols]]
+             for row in rows[1:]],
+            dtype=float
+        ).reshape(-1, n_cols)
+
+        # Drop rows without a K value and sort by K for binary search
+        has_K = ~np.isnan(values[:, 0])
+        values = values[has_K]
+        order = np.argsort(values[:, 0])
+        K_sorted = np.ascontiguousarray(values[order, 0])
+        # Column slicing leaves a strided view - copy to a C-contiguous
+        # block so the interpolation kernel reads sequential memory
+        data_sorted = np.ascontiguousarray(values[order][:, 1:])
+
+        # Parse the reflectance combinations encoded in the column names
+        # (e.g. "Rc70_Rw50_Rf20") once, at load time
+        parsed = []
+        refl_cols = []
+        refl_col_idx = []
+        for i, col in enumerate(header[1:]):
+            if col.startswith("Rc"):
+                parts = col.split("_")
+                if len(parts) == 3:
+                    try:
+                        # Extract Rc, Rw, Rf values from column names
+                        parsed.append((
+                            int(parts[0][2:]),  # Number after "Rc"
+                            int(parts[1][2:]),  # Number after "Rw"
+                            int(parts[2][2:])   # Number after "Rf"
+                        ))
+                        refl_cols.append(col)
+                        refl_col_idx.append(i)
+                    except (IndexError, ValueError):
+                        continue
+
+        return UFTable(
+            columns=tuple(header[1:]),
+            K_sorted=K_sorted,
+            data_sorted=data_sorted,
+            refl_rgb=np.array(parsed, dtype=np.int16).reshape(-1, 3),
+            refl_cols=tuple(refl_cols),
+            refl_col_idx=np.array(refl_col_idx, dtype=np.intp)
+        )
+
     except Exception as e:
         # Log error and re-raise with user-friendly message
         logging.error(f"Error loading CSV file: {e}")
         raise ValueError(f"Error loading CSV file: {e}")
 
-def extract_metadata(csv_file_path):
+# Parser for each metadata line, keyed by the label in the first CSV
+# column - each returns the dict entries to merge into the metadata
+_METADATA_PARSERS = {
+    # Fixture name is kept as-is
+    "Fixture Name": lambda value: {"Fixture Name": value},
+    # Luminous flux (light output) is formatted without decimals
+    "Luminous Flux": lambda value: {"Luminous Flux": f"{float(value):.0f}"},
+    # Wattage (power consumption) - remove the "W" suffix
+    "Wattage": lambda value: {"Wattage": float(value.strip().rstrip("W"))},
+    # Spacing-to-height ratio, plus the modified value used in layouts
+    "SHRNOM": lambda value: {"SHRNOM": float(value),
+                             "SHRNOM_Modified": float(value) * SHR_FACTOR},
+}
+
+def extract_metadata(csv_file):
     """
     Extract fixture metadata from the first 7 lines of CSV file.
-    
+
     Args:
-        csv_file_path: Path to the CSV file
-        
+        csv_file: Path to the CSV file, or an open file-like object
+
     Returns:
         Dictionary containing fixture metadata
-        
+
     Raises:
         ValueError: If metadata cannot be extracted
     """
     try:
         # Read just the first 7 lines (metadata section)
-        with open(csv_file_path, "r") as file:
-            lines = [next(file) for _ in range(7)]
+        if hasattr(csv_file, "read"):
+            lines = [next(csv_file) for _ in range(7)]
+        else:
+            with open(csv_file, "r") as file:
+                lines = [next(file) for _ in range(7)]
 
         metadata = {}  # Will store extracted metadata
-        
-        # Process each metadata line
+
+        # Single pass over the lines - each known label dispatches to its
+        # parser from the table above, no per-line if/elif chain
         for line in lines:
             parts = line.strip().split(",")
-            
-            # Extract fixture name
-            if parts[0] == "Fixture Name":
-                metadata["Fixture Name"] = parts[1]
-                
-            # Extract luminous flux (light output)
-            elif parts[0] == "Luminous Flux":
-                flux_value = float(parts[1])
-                metadata["Luminous Flux"] = f"{flux_value:.0f}"   
-                
-            # Extract wattage (power consumption)
-            elif parts[0] == "Wattage":
-                wattage_value = parts[1].strip().rstrip("W")  # Remove "W" suffix
-                metadata["Wattage"] = float(wattage_value)
-                
-            # Extract and calculate spacing-to-height ratio
-            elif parts[0] == "SHRNOM":
-                metadata["SHRNOM"] = float(parts[1])
-                metadata["SHRNOM_Modified"] = float(parts[1]) * SHR_FACTOR
+            parser = _METADATA_PARSERS.get(parts[0])
+            if parser is not None:
+                metadata.update(parser(parts[1]))
 
         return metadata
         
     except Exception as e:
         logging.error(f"Error extracting metadata: {e}")
         raise ValueError(f"Error extracting metadata: {e}")
+@dataclass(frozen=True)
+class LoadedFixture:
+    """Everything parsed out of one fixture CSV, ready for calculation."""
+    uf_table: UFTable  # Utilization factor table (holds the numeric arrays)
+    metadata: dict     # Fixture metadata (name, flux, wattage, SHRNOM)
+
+@functools.lru_cache(maxsize=8)
+def _load_fixture(csv_file_path, mtime):
+    """
+    Load and fully parse a fixture CSV, cached by (path, mtime).
+
+    Re-opening a file the user already loaded is served straight from
+    the cache with no disk I/O or parsing. The mtime argument is only
+    there to key the cache - if the file changes on disk the key changes
+    and the file is parsed again.
+
+    Args:
+        csv_file_path: Path to the CSV file
+        mtime: Modification time of the file (os.path.getmtime)
+
+    Returns:
+        LoadedFixture with the parsed table and metadata
+    """
+    # Read the file into memory once and feed both parsers from the buffer
+    with open(csv_file_path, "r") as file:
+        raw = file.read()
+
+    return LoadedFixture(
+        uf_table=load_uf_table(io.StringIO(raw)),
+        metadata=extract_metadata(io.StringIO(raw))
+    )
+# ==============================================
+# DEFERRED GUI UPDATE BATCHING
+# ==============================================
+class DeferredUpdates:
+    """
+    Context manager that batches StringVar updates so a burst of widget
+    changes triggers one idle-task flush instead of a redraw per set.
+
+    Usage:
+        with gui_updates as batch:
+            batch.set(some_var, "new value")
+            ...
+    """
+
+    def __init__(self):
+        self._pending = []    # (StringVar, value) pairs waiting to apply
+        self._active = False  # True while inside a with-block
+
+    def set(self, var, value):
+        """Set a StringVar now, or queue it if inside a with-block"""
+        if self._active:
+            self._pending.append((var, value))
+        else:
+            var.set(value)
+
+    def __enter__(self):
+        self._active = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._active = False
+
+        # Apply all queued updates back-to-back, then flush Tk's idle
+        # queue once so the whole batch paints in a single redraw
+        for var, value in self._pending:
+            var.set(value)
+        self._pending.clear()
+        root.update_idletasks()
+
+# Shared batching helper used by the GUI callbacks
+gui_updates = DeferredUpdates()
 # ==============================================
 # FILE LOADING FUNCTION FOR GUI
 # ==============================================
 
 def load_csv_file():
     """Handle CSV file selection and loading for the GUI."""
+    # Deferred import - only paid the first time the user loads a file
+    from tkinter import filedialog, messagebox
+
     # Show file selection dialog
     file_path = filedialog.askopenfilename(
         filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
@@ -378,22 +595,36 @@ def load_csv_file():
         try:
             # These are global variables that will store our data
             global uf_table, metadata
-            
-            # Load the utilization factor table
-            uf_table = load_uf_table(file_path)
-            
-            # Extract the fixture metadata
-            metadata = extract_metadata(file_path)
-            
-            # Update the GUI with loaded information
-            fixture_name.set(f"Fixture: {metadata['Fixture Name']}")
-            luminous_flux.set(f"Luminous Flux: {int(float(metadata['Luminous Flux']))} lumens")
-            wattage.set(f"Wattage: {metadata['Wattage']}W")
-            shr_nom.set(f"SHRNOM: {metadata['SHRNOM']:.2f} (Modified: {metadata['SHRNOM_Modified']:.2f})")
-            
-            # Show the file path in the entry box
-            csv_file_path_entry.delete(0, tk.END)
-            csv_file_path_entry.insert(0, file_path)
+            global _fixture_name_str, _luminous_flux_value, _wattage_value
+
+            # Load and parse the file (served from the cache if this
+            # exact file was already loaded and hasn't changed on disk)
+            fixture = _load_fixture(file_path, os.path.getmtime(file_path))
+            uf_table = fixture.uf_table
+            metadata = fixture.metadata
+
+            # Cache the numeric values once - Calculate reads these
+            # directly instead of re-parsing the display strings on
+            # every click
+            _fixture_name_str = metadata['Fixture Name']
+            _luminous_flux_value = float(metadata['Luminous Flux'])
+            _wattage_value = metadata['Wattage']
+
+            # Cached calculation results were produced against the
+            # previous UF table - throw them away
+            _compute.cache_clear()
+
+            # Update the GUI with loaded information - batched so the
+            # four labels and the path entry repaint together, once
+            with gui_updates as batch:
+                batch.set(fixture_name, f"Fixture: {metadata['Fixture Name']}")
+                batch.set(luminous_flux, f"Luminous Flux: {int(float(metadata['Luminous Flux']))} lumens")
+                batch.set(wattage, f"Wattage: {metadata['Wattage']}W")
+                batch.set(shr_nom, f"SHRNOM: {metadata['SHRNOM']:.2f} (Modified: {metadata['SHRNOM_Modified']:.2f})")
+
+                # Show the file path in the entry box
+                csv_file_path_entry.delete(0, tk.END)
+                csv_file_path_entry.insert(0, file_path)
             
             # Log successful load
             logging.info(f"CSV file loaded: {file_path}")
@@ -405,7 +636,8 @@ def load_csv_file():
 # LIGHTING CALCULATION FUNCTIONS
 # ==============================================
 
-def calculate_room_cavity_index(room_length, room_width, room_height, 
+@functools.lru_cache(maxsize=256)
+def calculate_room_cavity_index(room_length, room_width, room_height,
                               working_plane_height, suspension_distance):
     """
     Calculate the Room Cavity Index (K) - a measure of room proportions.
@@ -436,6 +668,21 @@ def calculate_room_cavity_index(room_length, room_width, room_height,
     # Standard formula for Room Cavity Index
     return (room_length * room_width) / (h * (room_length + room_width))
 
+@functools.lru_cache(maxsize=256)
+def _number_of_fixtures(E, room_length, room_width, luminous_flux, Uf, MF):
+    """
+    Cached numeric core of calculate_number_of_fixtures - takes already
+    validated floats so repeated calls with the same room geometry are
+    served from the cache.
+    """
+    # Standard lighting calculation formula, rounded up with the
+    # floor-division trick - equivalent to math.ceil for the positive
+    # values guaranteed by the caller's validation, without the
+    # float -> ceil -> int round trip
+    numerator = E * room_length * room_width
+    denominator = luminous_flux * Uf * MF
+    return int(-(-numerator // denominator))
+
 def calculate_number_of_fixtures(E, room_length, room_width, luminous_flux, Uf, MF=0.8):
     """
     Calculate how many fixtures are needed to achieve desired illuminance.
@@ -465,111 +712,57 @@ def calculate_number_of_fixtures(E, room_length, room_width, luminous_flux, Uf,
                 "and Maintenance Factor are valid numbers."
             )
             
-        # Standard lighting calculation formula
-        return math.ceil(
-            (E * room_length * room_width) / 
-            (luminous_flux * Uf * MF)
-        )
-        
+        # Hand the validated floats to the cached numeric core
+        return _number_of_fixtures(E, room_length, room_width,
+                                   luminous_flux, Uf, MF)
+
     except (ValueError, TypeError):
         raise ValueError("Invalid Luminous Flux value. Please check the CSV file.")
 
-def interpolate_uf(K, Rc, Rw, Rf, df):
+def interpolate_uf(K, Rc, Rw, Rf, table):
     """
     Find utilization factor (Uf) by interpolating between values in the table.
     Uf tables are provided by the manufacturer as part of the overall lighting report
-    
+
     Args:
         K: Room Cavity Index
         Rc: Ceiling reflectance (0-100)
         Rw: Walls reflectance (0-100)
         Rf: Floor reflectance (0-100)
-        df: DataFrame containing utilization factors
-        
+        table: UFTable containing utilization factors
+
     Returns:
         Interpolated utilization factor
-        
+
     Raises:
         ValueError: For invalid inputs or missing data
     """
     try:
-        # Convert K values column to numeric
-        df.iloc[:, 0] = pd.to_numeric(df.iloc[:, 0], errors="coerce")
-        
-        # Remove rows with missing K values
-        df = df.dropna(subset=[df.columns[0]])
+        # Verify the table contained usable K rows
+        if table.K_sorted.size == 0:
+            raise ValueError("No valid K values found in the CSV file.")
 
         # Get valid K value range from table
-        min_K = df.iloc[:, 0].min()
-        max_K = df.iloc[:, 0].max()
-        
+        min_K = table.K_sorted[0]
+        max_K = table.K_sorted[-1]
+
         # Check K is within table's range
         if K < min_K or K > max_K:
             raise ValueError(
                 f"Room Cavity Index (K) must be between {min_K} and {max_K}."
             )
 
-        # Find all reflectance combinations in the CSV columns
-        reflectance_combinations = {}
-        for col in df.columns[1:]:
-            if isinstance(col, str) and col.startswith("Rc"):
-                parts = col.split("_")
-                if len(parts) == 3:
-                    try:
-                        # Extract Rc, Rw, Rf values from column names
-                        Rc_val = int(parts[0][2:])  # Extract number after "Rc"
-                        Rw_val = int(parts[1][2:])  # Extract number after "Rw"
-                        Rf_val = int(parts[2][2:])  # Extract number after "Rf"
-                        reflectance_combinations[col] = (Rc_val, Rw_val, Rf_val)
-                    except (IndexError, ValueError):
-                        continue
-
-        # Verify we found valid reflectance columns
-        if not reflectance_combinations:
+        # Verify we found valid reflectance columns at load time
+        if len(table.refl_cols) < 2:
             raise ValueError("No valid reflectance columns found in the CSV file.")
 
-        # Find closest matching reflectance combinations
-        distances = []
-        for col, (Rc_csv, Rw_csv, Rf_csv) in reflectance_combinations.items():
-            # Calculate "distance" between requested and available reflectances
-            distance = abs(Rc_csv - Rc) + abs(Rw_csv - Rw) + abs(Rf_csv - Rf)
-            distances.append((distance, col))
-
-        # Sort by distance to find closest matches
-        distances.sort(key=lambda x: x[0])
-        col1 = distances[0][1]  # Closest match
-        col2 = distances[1][1]  # Second closest match
-
-        # Get all K values from the table
-        K_values = df.iloc[:, 0].values
-        
-        # Find the K values that bracket our calculated K
-        lower_K = K_values[K_values <= K].max()
-        upper_K = K_values[K_values >= K].min()
-
-        # Handle exact match case
-        if lower_K == upper_K:
-            Uf1 = df[df.iloc[:, 0] == lower_K][col1].values[0]
-            Uf2 = df[df.iloc[:, 0] == lower_K][col2].values[0]
-        else:
-            # Interpolate between bracketing K values for both reflectance combinations
-            Uf1_lower = df[df.iloc[:, 0] == lower_K][col1].values[0]
-            Uf1_upper = df[df.iloc[:, 0] == upper_K][col1].values[0]
-            Uf1 = Uf1_lower + (K - lower_K) * (Uf1_upper - Uf1_lower) / (upper_K - lower_K)
-
-            Uf2_lower = df[df.iloc[:, 0] == lower_K][col2].values[0]
-            Uf2_upper = df[df.iloc[:, 0] == upper_K][col2].values[0]
-            Uf2 = Uf2_lower + (K - lower_K) * (Uf2_upper - Uf2_lower) / (upper_K - lower_K)
-
-        # Calculate weights based on how close reflectances are
-        diff1 = distances[0][0]
-        diff2 = distances[1][0]
-        weight1 = 1 / (diff1 + 1e-9)  # Small number to avoid division by zero
-        weight2 = 1 / (diff2 + 1e-9)
-
-        # Final Uf is weighted average of two closest reflectance combinations
-        Uf = (Uf1 * weight1 + Uf2 * weight2) / (weight1 + weight2)
-        return float(Uf)
+        # All remaining numeric work (closest combinations, K bracketing,
+        # interpolation, weighted average) runs in the compiled kernel
+        return float(_interp_uf(
+            float(K), table.K_sorted, table.data_sorted,
+            table.refl_rgb, table.refl_col_idx,
+            float(Rc), float(Rw), float(Rf)
+        ))
 
     except Exception as e:
         logging.error(f"Error calculating Uf: {e}")
@@ -616,6 +809,69 @@ def validate_input(value, field_name, min_value=None, max_value=None):
             f"Invalid input for {field_name}. Please enter a numeric value."
         )
 
+# Field name and allowed range for each input box, in the same order as
+# input_entries. None means no bound on that side.
+_INPUT_SPECS = [
+    ("Room Length", 0.1, None),
+    ("Room Width", 0.1, None),
+    ("Room Height", 0.1, None),
+    ("Working Plane Height", 0.1, None),
+    ("Suspension Distance", 0, None),
+    ("Ceiling Reflectance", 0, 100),
+    ("Walls Reflectance", 0, 100),
+    ("Floor Reflectance", 0, 100),
+    ("Required Illuminance", 0, None),
+    ("Maintenance Factor", 0, 1),
+]
+
+# Bounds as arrays (missing bounds become infinities) so all ten inputs
+# can be range-checked with two vectorized comparisons
+_INPUT_MINS = np.fromiter(
+    (-np.inf if mn is None else mn for _, mn, _mx in _INPUT_SPECS), dtype=float
+)
+_INPUT_MAXS = np.fromiter(
+    (np.inf if mx is None else mx for _, _mn, mx in _INPUT_SPECS), dtype=float
+)
+
+
+def _validate_all_inputs(raw_values):
+    """
+    Validate every input box in a single pass.
+
+    Converts all the values at once and checks them against the bounds
+    with two NumPy comparisons instead of ten separate Python calls.
+    If anything fails, falls back to validate_input field by field so
+    the user still gets the precise error message for the offending
+    input.
+
+    Args:
+        raw_values: Input box contents, in _INPUT_SPECS order
+
+    Returns:
+        List of validated numeric values, in the same order
+
+    Raises:
+        ValueError: For invalid inputs
+    """
+    # Fast path - all values numeric and inside their ranges
+    try:
+        values = np.fromiter(
+            (float(value) for value in raw_values),
+            dtype=float,
+            count=len(_INPUT_SPECS)
+        )
+        if (values >= _INPUT_MINS).all() and (values <= _INPUT_MAXS).all():
+            return values.tolist()
+    except ValueError:
+        pass
+
+    # Slow path - something is wrong, re-validate field by field to
+    # raise the same error message as before
+    return [
+        validate_input(value, name, min_value=mn, max_value=mx)
+        for value, (name, mn, mx) in zip(raw_values, _INPUT_SPECS)
+    ]
+
 def calculate_aspect_ratio(room_length, room_width):
     """
     Calculate length-to-width ratio of the room.
@@ -659,88 +915,100 @@ def calculate_shr(spacing, mounting_height):
         return float('inf')  # Invalid mounting height
     return spacing / mounting_height
 
-def find_valid_arrays(num_fixtures, aspect_ratio, room_length, 
-                     room_width, mounting_height, shr_nom):
+@dataclass(slots=True, frozen=True)
+class ArrayResult:
+    """
+    One valid fixture arrangement found by find_valid_arrays.
+
+    A slotted dataclass is lighter and faster to access than the dict
+    this used to be - fixed fields instead of per-instance hash lookups.
+    """
+    array: tuple              # (fixtures along length, fixtures across width)
+    spacing_length: float     # Spacing between fixtures along length (meters)
+    spacing_width: float      # Spacing between fixtures along width (meters)
+    shr_length: float         # Spacing-to-height ratio along length
+    shr_width: float          # Spacing-to-height ratio along width
+    fixtures: int             # Total fixture count (along * across)
+
+    @property
+    def parity(self):
+        """'even' or 'odd', from the across-width fixture count."""
+        return 'even' if self.array[1] % 2 == 0 else 'odd'
+
+
+def _layout_entry(along, across, spacing_length, spacing_width,
+                  shr_length, shr_width):
+    """Build the ArrayResult for one valid arrangement."""
+    along = int(along)
+    across = int(across)
+    return ArrayResult(
+        array=(along, across),
+        spacing_length=float(spacing_length),
+        spacing_width=float(spacing_width),
+        shr_length=float(shr_length),
+        shr_width=float(shr_width),
+        fixtures=along * across
+    )
+
+@functools.lru_cache(maxsize=64)
+def find_valid_arrays(num_fixtures, aspect_ratio, room_length,
+                     room_width, mounting_height, shr_nom_value):
     """
     Find valid fixture arrangements meeting SHR and spacing requirements.
-    
+
+    Pure function of its arguments (callers pass the modified SHRNOM
+    value explicitly), so repeated calls with unchanged inputs are
+    served from the lru_cache.
+
     Args:
         num_fixtures: Calculated number of fixtures needed
         aspect_ratio: Room length-to-width ratio
         room_length: Room length in meters
         room_width: Room width in meters
         mounting_height: Fixture mounting height in meters
-        shr_nom: Nominal SHR value from metadata
-        
+        shr_nom_value: Modified nominal SHR value from metadata
+
     Returns:
         Tuple of (best_even_array, best_odd_array) layouts
     """
-    # Use the modified SHRNOM value from metadata
-    shr_nom_value = metadata['SHRNOM_Modified']
-    valid_arrays = []
-    
-    # Try different numbers of rows and columns
-    max_dim = num_fixtures + 3  # Don't try more than this
-    
-    for rows in range(1, max_dim + 1):
-        for cols in range(1, max_dim + 1):
-            # Skip combinations that don't provide enough fixtures
-            if rows * cols < num_fixtures:
-                continue
-                
-            # Determine orientation based on room shape
-            if aspect_ratio >= 1:  # Longer than wide
-                along_length, across_width = max(rows, cols), min(rows, cols)
-            else:  # Wider than long
-                along_length, across_width = min(rows, cols), max(rows, cols)
-            
-            # Calculate spacing in both directions
-            spacing_length = calculate_spacing(room_length, along_length)
-            spacing_width = calculate_spacing(room_width, across_width)
-            
-            # Calculate SHR in both directions
-            shr_length = calculate_shr(spacing_length, mounting_height)
-            shr_width = calculate_shr(spacing_width, mounting_height)
-            
-            # Check if this arrangement meets SHR requirements
-            shr_valid = (shr_length <= shr_nom_value and 
-                        shr_width <= shr_nom_value)
-            
-            # Check minimum spacing requirements with special cases:
-            if along_length == 1:  # Single row along length
-                spacing_valid = spacing_width >= MIN_SPACING if across_width > 1 else True
-            elif across_width == 1:  # Single column across width
-                spacing_valid = spacing_length >= MIN_SPACING if along_length > 1 else True
-            else:  # Multiple rows and columns
-                spacing_valid = (spacing_length >= MIN_SPACING and 
-                                spacing_width >= MIN_SPACING)
-            
-            # Only add if both SHR and spacing requirements are met
-            if shr_valid and spacing_valid:
-                valid_arrays.append({
-                    'array': (along_length, across_width),
-                    'spacing_length': spacing_length,
-                    'spacing_width': spacing_width,
-                    'shr_length': shr_length,
-                    'shr_width': shr_width,
-                    'fixtures': along_length * across_width,
-                    'parity': 'even' if across_width % 2 == 0 else 'odd'
-                })
-    
-    # Remove duplicate arrangements and sort by closest to target fixture count
-    unique_arrays = []
-    seen = set()
-    for arr in sorted(valid_arrays, 
-                     key=lambda x: (abs(x['fixtures'] - num_fixtures), x['fixtures'])):
-        key = arr['array']
-        if key not in seen:
-            seen.add(key)
-            unique_arrays.append(arr)
-    
-    # Find one even and one odd arrangement
-    even_array = next((a for a in unique_arrays if a['parity'] == 'even'), None)
-    odd_array = next((a for a in unique_arrays if a['parity'] == 'odd'), None)
-    
+    # Upper bound on fixtures in either direction (as before)
+    max_dim = num_fixtures + 3
+
+    # Preallocated output buffers for the compiled kernel - it records at
+    # most the first valid arrangement of each parity, so a small fixed
+    # size is plenty
+    buffer_size = 16
+    out_along = np.empty(buffer_size, dtype=np.int64)
+    out_across = np.empty(buffer_size, dtype=np.int64)
+    out_sl = np.empty(buffer_size, dtype=np.float64)
+    out_sw = np.empty(buffer_size, dtype=np.float64)
+    out_shr_l = np.empty(buffer_size, dtype=np.float64)
+    out_shr_w = np.empty(buffer_size, dtype=np.float64)
+
+    # The divisor-enumeration search runs entirely inside the compiled
+    # kernel - no NumPy temporaries on the hot path
+    count = _enumerate_valid(
+        int(num_fixtures), int(max_dim),
+        float(aspect_ratio), float(room_length), float(room_width),
+        float(mounting_height), float(shr_nom_value), MIN_SPACING,
+        out_along, out_across, out_sl, out_sw, out_shr_l, out_shr_w
+    )
+
+    # Keep the first recorded arrangement of each parity (dicts are only
+    # built for the at most two returned entries)
+    even_array = None
+    odd_array = None
+    for i in range(count):
+        if out_across[i] % 2 == 0:
+            if even_array is None:
+                even_array = _layout_entry(out_along[i], out_across[i],
+                                           out_sl[i], out_sw[i],
+                                           out_shr_l[i], out_shr_w[i])
+        elif odd_array is None:
+            odd_array = _layout_entry(out_along[i], out_across[i],
+                                      out_sl[i], out_sw[i],
+                                      out_shr_l[i], out_shr_w[i])
+
     return even_array, odd_array
 
 def calculate_adjusted_light_level(E, num_fixtures, actual_fixtures):
@@ -756,136 +1024,192 @@ def calculate_adjusted_light_level(E, num_fixtures, actual_fixtures):
         Adjusted illuminance level in lux
     """
     return E * (actual_fixtures / num_fixtures)
+
+
+def format_array(array_data, E, num_fixtures):
+    """
+    Format array information for display in results table.
+
+    Args:
+        array_data: ArrayResult from find_valid_arrays (or None)
+        E: Target illuminance in lux
+        num_fixtures: Calculated number of fixtures needed
+
+    Returns:
+        Human-readable summary string for one arrangement
+    """
+    if not array_data:
+        return "No valid array found (spacing or SHR constraints not met)"
+
+    array = array_data.array
+    spacing_length = array_data.spacing_length
+    spacing_width = array_data.spacing_width
+    actual_fixtures = array_data.fixtures
+    adjusted_E = calculate_adjusted_light_level(E, num_fixtures, actual_fixtures)
+
+    # Check spacing against minimum requirements
+    spacing_status = []
+    if array[0] > 1 and spacing_length < MIN_SPACING:
+        spacing_status.append(f"Length spacing < {MIN_SPACING}m")
+    if array[1] > 1 and spacing_width < MIN_SPACING:
+        spacing_status.append(f"Width spacing < {MIN_SPACING}m")
+
+    spacing_note = " | Spacing OK" if not spacing_status else " | Spacing issues: " + ", ".join(spacing_status)
+
+    return (
+        f"{array[0]} along length, {array[1]} across width | "
+        f"Spacing: {spacing_length:.2f}m (L), {spacing_width:.2f}m (W){spacing_note} | "
+        f"SHR: {array_data.shr_length:.2f} (L), {array_data.shr_width:.2f} (W) | "
+        f"Fixtures: {actual_fixtures}, Lux: {adjusted_E:.0f}"
+    )
 # ==============================================
 # MAIN CALCULATION FUNCTION
 # ==============================================
 
+@functools.lru_cache(maxsize=64)
+def _compute(room_length, room_width, room_height, working_plane_height,
+             suspension_distance, ceiling_reflectance, walls_reflectance,
+             floor_reflectance, E, MF, luminous_flux, shr_nom_value):
+    """
+    Run the full numeric pipeline for one set of validated inputs.
+
+    This is everything the Calculate button does except reading widgets
+    and writing results back to the GUI. Keeping it as a pure function
+    of its arguments lets lru_cache skip the whole pipeline when the
+    user recalculates with unchanged inputs (the common case when
+    tweaking a single field back and forth).
+
+    The cache is cleared in load_csv_file because the result also
+    depends on the loaded UF table.
+
+    Returns:
+        Dict with K, Uf, num_fixtures, mounting_height, even_array
+        and odd_array
+    """
+    K = calculate_room_cavity_index(
+        room_length,
+        room_width,
+        room_height,
+        working_plane_height,
+        suspension_distance
+    )
+    Uf = interpolate_uf(
+        K,
+        ceiling_reflectance,
+        walls_reflectance,
+        floor_reflectance,
+        uf_table
+    )
+    num_fixtures = calculate_number_of_fixtures(
+        E,
+        room_length,
+        room_width,
+        luminous_flux,
+        Uf,
+        MF
+    )
+
+    # Calculate mounting height (distance from work plane to fixtures)
+    mounting_height = (room_height - working_plane_height) - suspension_distance
+    if mounting_height <= 0:
+        raise ValueError(
+            "Invalid mounting height (check room height and suspension distance)"
+        )
+
+    # Find valid fixture arrangements
+    aspect_ratio = calculate_aspect_ratio(room_length, room_width)
+    even_array, odd_array = find_valid_arrays(
+        num_fixtures,
+        aspect_ratio,
+        room_length,
+        room_width,
+        mounting_height,
+        shr_nom_value
+    )
+
+    return {
+        'K': K,
+        'Uf': Uf,
+        'num_fixtures': num_fixtures,
+        'mounting_height': mounting_height,
+        'even_array': even_array,
+        'odd_array': odd_array
+    }
+
+
+# Most recent results rows, kept here so the clipboard copy can
+# serialize them directly instead of reading them back out of the
+# Treeview widget one Tcl call at a time
+_last_results = None
+
+# Signature of the layouts currently drawn on the canvases. Everything
+# the drawings depend on (room dimensions and the two fixture grids) is
+# captured here, so a recalculation that lands on the same layouts can
+# skip the clear-and-redraw entirely.
+_last_layout_sig = None
+
+
 def calculate_and_display():
     """
     Main function that runs when Calculate button is clicked.
     Performs all calculations and updates the GUI with results.
     """
+    global _last_results, _last_layout_sig
+    # Deferred import - only needed to report errors to the user
+    from tkinter import messagebox
+
     try:
-        # Get and validate all input values
-        room_length = validate_input(room_length_entry.get(), "Room Length", min_value=0.1)
-        room_width = validate_input(room_width_entry.get(), "Room Width", min_value=0.1)
-        room_height = validate_input(room_height_entry.get(), "Room Height", min_value=0.1)
-        working_plane_height = validate_input(
-            working_plane_height_entry.get(), 
-            "Working Plane Height", 
-            min_value=0.1
-        )
-        suspension_distance = validate_input(
-            suspension_distance_entry.get(), 
-            "Suspension Distance", 
-            min_value=0
-        )
-        ceiling_reflectance = validate_input(
-            ceiling_reflectance_entry.get(), 
-            "Ceiling Reflectance", 
-            min_value=0, 
-            max_value=100
+        # Get and validate all input values in one vectorized pass
+        (room_length, room_width, room_height, working_plane_height,
+         suspension_distance, ceiling_reflectance, walls_reflectance,
+         floor_reflectance, E, MF) = _validate_all_inputs(
+            [entry.get() for entry in input_entries]
         )
-        walls_reflectance = validate_input(
-            walls_reflectance_entry.get(), 
-            "Walls Reflectance", 
-            min_value=0, 
-            max_value=100
-        )
-        floor_reflectance = validate_input(
-            floor_reflectance_entry.get(), 
-            "Floor Reflectance", 
-            min_value=0, 
-            max_value=100
-        )
-        E = validate_input(E_entry.get(), "Required Illuminance", min_value=0)
-        MF = validate_input(MF_entry.get(), "Maintenance Factor", min_value=0, max_value=1)
 
         # Get values from the loaded CSV file
-        luminous_flux_value = float(luminous_flux.get().split(":")[1].strip().split()[0])
-        wattage_value = float(wattage.get().split(":")[1].strip().rstrip("W"))
+        # These were cached as plain numbers at CSV load time - no
+        # display-string re-parsing per click
+        luminous_flux_value = _luminous_flux_value
+        wattage_value = _wattage_value
+        shr_nom_csv = metadata['SHRNOM']
         shr_nom_value = metadata['SHRNOM_Modified']  # Using modified value
 
-        # Perform all calculations
-        K = calculate_room_cavity_index(
-            room_length, 
-            room_width, 
-            room_height, 
-            working_plane_height, 
-            suspension_distance
-        )
-        Uf = interpolate_uf(
-            K, 
-            ceiling_reflectance, 
-            walls_reflectance, 
-            floor_reflectance, 
-            uf_table
-        )
-        num_fixtures = calculate_number_of_fixtures(
-            E, 
-            room_length, 
-            room_width, 
-            luminous_flux_value, 
-            Uf, 
-            MF
-        )
-
-        # Calculate mounting height (distance from work plane to fixtures)
-        mounting_height = (room_height - working_plane_height) - suspension_distance
-        if mounting_height <= 0:
-            raise ValueError(
-                "Invalid mounting height (check room height and suspension distance)"
-            )
-
-        # Find valid fixture arrangements
-        aspect_ratio = calculate_aspect_ratio(room_length, room_width)
-        even_array, odd_array = find_valid_arrays(
-            num_fixtures, 
-            aspect_ratio, 
-            room_length, 
-            room_width, 
-            mounting_height, 
+        # Perform all calculations (memoized - a repeat click with the
+        # same inputs is served straight from the cache)
+        computed = _compute(
+            room_length,
+            room_width,
+            room_height,
+            working_plane_height,
+            suspension_distance,
+            ceiling_reflectance,
+            walls_reflectance,
+            floor_reflectance,
+            E,
+            MF,
+            luminous_flux_value,
             shr_nom_value
         )
-
-        def format_array(array_data):
-            """Format array information for display in results table."""
-            if not array_data:
-                return "No valid array found (spacing or SHR constraints not met)"
-                
-            array = array_data['array']
-            spacing_length = array_data['spacing_length']
-            spacing_width = array_data['spacing_width']
-            actual_fixtures = array_data['fixtures']
-            adjusted_E = calculate_adjusted_light_level(E, num_fixtures, actual_fixtures)
-            
-            # Check spacing against minimum requirements
-            spacing_status = []
-            if array[0] > 1 and spacing_length < MIN_SPACING:
-                spacing_status.append(f"Length spacing < {MIN_SPACING}m")
-            if array[1] > 1 and spacing_width < MIN_SPACING:
-                spacing_status.append(f"Width spacing < {MIN_SPACING}m")
-            
-            spacing_note = " | Spacing OK" if not spacing_status else " | Spacing issues: " + ", ".join(spacing_status)
-            
-            return (
-                f"{array[0]} along length, {array[1]} across width | "
-                f"Spacing: {spacing_length:.2f}m (L), {spacing_width:.2f}m (W){spacing_note} | "
-                f"SHR: {array_data['shr_length']:.2f} (L), {array_data['shr_width']:.2f} (W) | "
-                f"Fixtures: {actual_fixtures}, Lux: {adjusted_E:.0f}"
-            )
-
-        # Clear previous results from the table
-        for widget in result_table.get_children():
-            result_table.delete(widget)
+        K = computed['K']
+        Uf = computed['Uf']
+        num_fixtures = computed['num_fixtures']
+        mounting_height = computed['mounting_height']
+        even_array = computed['even_array']
+        odd_array = computed['odd_array']
+
+        # Clear previous results from the table - delete() accepts any
+        # number of items, so one Tcl call empties the whole table
+        children = result_table.get_children()
+        if children:
+            result_table.delete(*children)
 
         # Prepare all results for display
         results = [
-            ("Fixture Name", fixture_name.get().split(":")[1].strip()),
+            ("Fixture Name", _fixture_name_str),
             ("Luminous Flux", f"{luminous_flux_value:.0f} lumens"),
             ("Wattage", f"{wattage_value:.0f} W"),
-            ("SHRNOM (CSV)", f"{metadata['SHRNOM']:.2f}"),
-            ("SHRNOM (Modified)", f"{metadata['SHRNOM_Modified']:.2f}"),
+            ("SHRNOM (CSV)", f"{shr_nom_csv:.2f}"),
+            ("SHRNOM (Modified)", f"{shr_nom_value:.2f}"),
             ("Minimum Spacing", f"{MIN_SPACING} m (hard-coded)"),
             ("Room Length", f"{room_length:.1f} m"),
             ("Room Width", f"{room_width:.1f} m"),
@@ -901,34 +1225,47 @@ def calculate_and_display():
             ("Room Cavity Index (K)", f"{K:.2f}"),
             ("Utilisation Factor (Uf)", f"{Uf:.2f}"),
             ("Number of Fixtures", f"{num_fixtures}"),
-            ("Valid Array (Even)", format_array(even_array)),
-            ("Valid Array (Odd)", format_array(odd_array))
+            ("Valid Array (Even)", format_array(even_array, E, num_fixtures)),
+            ("Valid Array (Odd)", format_array(odd_array, E, num_fixtures))
         ]
 
         # Add results to the table
         for row in results:
             result_table.insert("", "end", values=row)
 
-        # Update visualizations
-        visualizer.clear_visualizations()
-        
-        # Draw even array layout if it exists
-        if even_array:
-            visualizer.draw_room_layout(
-                room_length,
-                room_width,
-                even_array,
-                f"Even Array: {even_array['array'][0]}×{even_array['array'][1]} Fixtures"
-            )
-        
-        # Draw odd array layout if it exists
-        if odd_array:
-            visualizer.draw_room_layout(
-                room_length,
-                room_width,
-                odd_array,
-                f"Odd Array: {odd_array['array'][0]}×{odd_array['array'][1]} Fixtures"
-            )
+        # Remember the rows for copy_to_clipboard
+        _last_results = results
+
+        # Update visualizations - skipped entirely when what's already
+        # on the canvases would be redrawn unchanged
+        layout_sig = (
+            room_length,
+            room_width,
+            even_array.array if even_array else None,
+            odd_array.array if odd_array else None
+        )
+        if layout_sig != _last_layout_sig:
+            visualizer.clear_visualizations()
+
+            # Draw even array layout if it exists
+            if even_array:
+                visualizer.draw_room_layout(
+                    room_length,
+                    room_width,
+                    even_array,
+                    f"Even Array: {even_array.array[0]}×{even_array.array[1]} Fixtures"
+                )
+
+            # Draw odd array layout if it exists
+            if odd_array:
+                visualizer.draw_room_layout(
+                    room_length,
+                    room_width,
+                    odd_array,
+                    f"Odd Array: {odd_array.array[0]}×{odd_array.array[1]} Fixtures"
+                )
+
+            _last_layout_sig = layout_sig
 
         logging.info("Calculation completed successfully.")
         
@@ -941,16 +1278,17 @@ def calculate_and_display():
 
 def copy_to_clipboard():
     """Copy the results table contents to system clipboard."""
-    try:
-        results = []
-        
-        # Get all results from the table
-        for child in result_table.get_children():
-            values = result_table.item(child, "values")
-            results.append(f"{values[0]}: {values[1]}")
+    # Deferred import - only paid when the user copies results
+    from tkinter import messagebox
 
-        # Combine into a single string
-        results_text = "\n".join(results)
+    try:
+        # Serialize the rows remembered by the last calculation - no
+        # need to query the Treeview row by row
+        results_text = ""
+        if _last_results:
+            results_text = "\n".join(
+                f"{name}: {value}" for name, value in _last_results
+            )
         
         if results_text:
             # Copy to clipboard
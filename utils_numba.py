@@ -0,0 +1,195 @@
+"""
+Numba-accelerated numeric kernels for the Voltex Highbay Calculator.
+
+The hot numeric core of interpolate_uf (reflectance distance search,
+binary search on K, linear interpolation, weighted average) is pure
+scalar math, so it is compiled to machine code with Numba. cache=True
+stores the compiled code on disk, so the compilation cost is only paid
+the very first time the app runs.
+
+If Numba is not installed the kernels still work - they just run as
+plain Python functions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba not installed - define a do-nothing decorator so the kernels
+    # fall back to plain (slower but correct) Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _enumerate_valid(num_fixtures, max_dim, aspect_ratio, room_length,
+                     room_width, mounting_height, shr_nom_value, min_spacing,
+                     out_along, out_across, out_sl, out_sw,
+                     out_shr_l, out_shr_w):
+    """
+    Compiled kernel for the fixture layout search.
+
+    Walks candidate fixture totals upward from num_fixtures, visiting
+    only the divisor pairs of each total (capped at max_dim fixtures per
+    direction), and records the first valid arrangement of each across-
+    count parity into the preallocated output buffers. Stops as soon as
+    one even and one odd arrangement have been found - because totals
+    increase monotonically, those are the arrangements closest to the
+    target fixture count.
+
+    Args:
+        num_fixtures: Target number of fixtures
+        max_dim: Maximum fixtures allowed in either direction
+        aspect_ratio: Room length-to-width ratio
+        room_length, room_width: Room dimensions in meters
+        mounting_height: Fixture mounting height in meters
+        shr_nom_value: Maximum allowed SHR
+        min_spacing: Minimum allowed fixture spacing in meters
+        out_*: Preallocated output buffers, filled up to the returned count
+
+    Returns:
+        Number of arrangements written into the buffers
+    """
+    count = 0
+    found_even = False
+    found_odd = False
+
+    start = num_fixtures if num_fixtures > 1 else 1
+    for total in range(start, max_dim * max_dim + 1):
+        # Walk divisor pairs (a, b) of this total with a <= b
+        a = 1
+        while a * a <= total:
+            if total % a == 0:
+                b = total // a
+                if b <= max_dim:
+                    # Determine orientation based on room shape
+                    if aspect_ratio >= 1.0:  # Longer than wide
+                        along = b
+                        across = a
+                    else:                    # Wider than long
+                        along = a
+                        across = b
+
+                    # Spacing in both directions (single fixture uses the
+                    # full dimension)
+                    sl = room_length if along <= 1 else room_length / along
+                    sw = room_width if across <= 1 else room_width / across
+
+                    # SHR in both directions (infinite if height invalid)
+                    if mounting_height > 0:
+                        shr_l = sl / mounting_height
+                        shr_w = sw / mounting_height
+                    else:
+                        shr_l = np.inf
+                        shr_w = np.inf
+
+                    # SHR requirement in both directions
+                    shr_ok = shr_l <= shr_nom_value and shr_w <= shr_nom_value
+
+                    # Minimum spacing requirement, with the special cases
+                    # for single rows/columns
+                    if along == 1:
+                        spacing_ok = across <= 1 or sw >= min_spacing
+                    elif across == 1:
+                        spacing_ok = sl >= min_spacing
+                    else:
+                        spacing_ok = sl >= min_spacing and sw >= min_spacing
+
+                    # Only record the first arrangement of each parity -
+                    # later ones of the same parity can't rank better
+                    is_even = across % 2 == 0
+                    wanted = (is_even and not found_even) or \
+                             (not is_even and not found_odd)
+                    if (shr_ok and spacing_ok and wanted and
+                            count < out_along.shape[0]):
+                        out_along[count] = along
+                        out_across[count] = across
+                        out_sl[count] = sl
+                        out_sw[count] = sw
+                        out_shr_l[count] = shr_l
+                        out_shr_w[count] = shr_w
+                        count += 1
+                        if is_even:
+                            found_even = True
+                        else:
+                            found_odd = True
+            a += 1
+
+        # Stop as soon as both parities have been found
+        if found_even and found_odd:
+            break
+
+    return count
+
+
+@njit(cache=True, fastmath=True)
+def _interp_uf(K, K_sorted, data_sorted, refl_rgb, refl_col_idx, Rc, Rw, Rf):
+    """
+    Compiled kernel for utilization factor interpolation.
+
+    Args:
+        K: Room Cavity Index (already range-checked by the caller)
+        K_sorted: 1D array of K values, sorted ascending
+        data_sorted: 2D array of Uf values, rows matching K_sorted
+        refl_rgb: (n, 3) int array of (Rc, Rw, Rf) per reflectance column
+        refl_col_idx: column position in data_sorted for each combination
+        Rc, Rw, Rf: Requested ceiling/walls/floor reflectances
+
+    Returns:
+        Interpolated utilization factor
+    """
+    # Find the two reflectance combinations closest to the request
+    # (explicit loop - only a handful of combinations, no sort needed)
+    best = -1
+    second = -1
+    best_dist = 1e18
+    second_dist = 1e18
+    for i in range(refl_rgb.shape[0]):
+        dist = (abs(refl_rgb[i, 0] - Rc) +
+                abs(refl_rgb[i, 1] - Rw) +
+                abs(refl_rgb[i, 2] - Rf))
+        if dist < best_dist:
+            second = best
+            second_dist = best_dist
+            best = i
+            best_dist = dist
+        elif dist < second_dist:
+            second = i
+            second_dist = dist
+
+    col1 = refl_col_idx[best]
+    col2 = refl_col_idx[second]
+
+    # Binary search for the K values that bracket our calculated K
+    lo = 0
+    hi = K_sorted.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if K_sorted[mid] < K:
+            lo = mid + 1
+        else:
+            hi = mid
+    idx = lo
+
+    if K_sorted[idx] == K:
+        # Exact match - no interpolation along K needed
+        Uf1 = data_sorted[idx, col1]
+        Uf2 = data_sorted[idx, col2]
+    else:
+        # Interpolate between bracketing K values for both combinations
+        lower = idx - 1
+        upper = idx
+        fraction = (K - K_sorted[lower]) / (K_sorted[upper] - K_sorted[lower])
+        Uf1 = (data_sorted[lower, col1] +
+               fraction * (data_sorted[upper, col1] - data_sorted[lower, col1]))
+        Uf2 = (data_sorted[lower, col2] +
+               fraction * (data_sorted[upper, col2] - data_sorted[lower, col2]))
+
+    # Weighted average of the two closest reflectance combinations
+    # (small epsilon avoids division by zero on an exact match)
+    weight1 = 1.0 / (best_dist + 1e-9)
+    weight2 = 1.0 / (second_dist + 1e-9)
+    return (Uf1 * weight1 + Uf2 * weight2) / (weight1 + weight2)